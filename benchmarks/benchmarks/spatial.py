@@ -22,6 +22,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from scipy.spatial.transform import Rotation
+except ImportError:
+    pass
+
 from .common import Benchmark
 
 
@@ -299,3 +304,32 @@ class Hausdorff(Benchmark):
         # time directed_hausdorff code in 3 D
         distance.directed_hausdorff(self.points1, self.points2)
 
+
+class RotationConversions(Benchmark):
+    params = [1, 10, 1000, 100000]
+    param_names = ['num_rotations']
+
+    def setup(self, num_rotations):
+        self.rotations = Rotation.random(num_rotations, random_state=1234)
+        self.quat = self.rotations.as_quat()
+        self.dcm = self.rotations.as_dcm()
+        self.rotvec = self.rotations.as_rotvec()
+        self.euler = self.rotations.as_euler('zyx')
+
+    def time_from_quat(self, num_rotations):
+        Rotation.from_quat(self.quat)
+
+    def time_as_dcm(self, num_rotations):
+        self.rotations.as_dcm()
+
+    def time_from_dcm(self, num_rotations):
+        Rotation.from_dcm(self.dcm)
+
+    def time_as_rotvec(self, num_rotations):
+        self.rotations.as_rotvec()
+
+    def time_from_rotvec(self, num_rotations):
+        Rotation.from_rotvec(self.rotvec)
+
+    def time_from_euler(self, num_rotations):
+        Rotation.from_euler('zyx', self.euler)
@@ -1,13 +1,39 @@
 from __future__ import division, print_function, absolute_import
 
+import math
 import re
 import warnings
 import numpy as np
-import scipy.linalg
 from scipy._lib._util import check_random_state
 
 
 _AXIS_TO_IND = {'x': 0, 'y': 1, 'z': 2}
+# Index of the axis following each of x, y and z in cyclic order
+_NEXT_AXIS_IND = np.array([1, 2, 0])
+
+_INTRINSIC_RE = re.compile(r'^[XYZ]{1,3}$')
+_EXTRINSIC_RE = re.compile(r'^[xyz]{1,3}$')
+
+# Rotation angle at or below which the conversions between rotation vectors
+# and quaternions use a Taylor expansion instead of the exact expression
+_SMALL_ANGLE = 1e-3
+
+
+def _row_norms(a):
+    # Euclidean norm of each row of a 2D array, accumulated in a single pass
+    # without forming `a * a` and without the overhead of `scipy.linalg.norm`.
+    return np.sqrt(np.einsum('ij,ij->i', a, a))
+
+
+def _double_precision_quat(quat):
+    # Unit quaternions `quat` in double precision. Single precision input is
+    # renormalized after conversion, as its rounding errors would otherwise
+    # show up in the conversions as errors of order sqrt(eps).
+    if quat.dtype == np.float64:
+        return quat
+    quat = quat.astype(np.float64)
+    quat /= _row_norms(quat)[:, None]
+    return quat
 
 
 def _elementary_basis_vector(axis):
@@ -143,17 +169,32 @@ def _compute_euler_from_dcm(dcm, seq, extrinsic=False):
 
 def _make_elementary_quat(axis, angles):
     quat = np.zeros((angles.shape[0], 4))
-
-    quat[:, 3] = np.cos(angles / 2)
-    quat[:, _AXIS_TO_IND[axis]] = np.sin(angles / 2)
+    axis_ind = _AXIS_TO_IND[axis]
+
+    if angles.shape[0] == 1:
+        # Use scalar math for a single rotation, NumPy ufunc dispatch would
+        # dominate the cost of the two trigonometric evaluations
+        half_angle = float(angles[0]) / 2
+        quat[0, 3] = math.cos(half_angle)
+        quat[0, axis_ind] = math.sin(half_angle)
+    else:
+        half_angles = angles / 2
+        quat[:, 3] = np.cos(half_angles)
+        quat[:, axis_ind] = np.sin(half_angles)
     return quat
 
 
 def _compose_quat(p, q):
-    product = np.empty((max(p.shape[0], q.shape[0]), 4))
-    product[:, 3] = p[:, 3] * q[:, 3] - np.sum(p[:, :3] * q[:, :3], axis=1)
-    product[:, :3] = (p[:, None, 3] * q[:, :3] + q[:, None, 3] * p[:, :3] +
-                      np.cross(p[:, :3], q[:, :3]))
+    # Hamilton product written out per component; this avoids the overhead
+    # of `np.cross` and of the (N, 3) temporaries of the vector form.
+    product = np.empty((max(p.shape[0], q.shape[0]), 4),
+                       dtype=np.result_type(p, q))
+    px, py, pz, pw = p.T
+    qx, qy, qz, qw = q.T
+    product[:, 0] = pw * qx + px * qw + py * qz - pz * qy
+    product[:, 1] = pw * qy + py * qw + pz * qx - px * qz
+    product[:, 2] = pw * qz + pz * qw + px * qy - py * qx
+    product[:, 3] = pw * qw - px * qx - py * qy - pz * qz
     return product
 
 
@@ -172,6 +213,237 @@ def _elementary_quat_compose(seq, angles, intrinsic=False):
     return result
 
 
+def _make_quat_to_dcm_coeffs():
+    # Each entry of a direction cosine matrix is a linear combination of the
+    # pairwise products of quaternion components:
+    # dcm[i, j] = sum(q[a] * q[b] * coeffs[a, b, i, j])
+    x, y, z, w = range(4)
+    coeffs = np.zeros((4, 4, 3, 3))
+
+    coeffs[x, x, 0, 0] = coeffs[w, w, 0, 0] = 1
+    coeffs[y, y, 0, 0] = coeffs[z, z, 0, 0] = -1
+    coeffs[y, y, 1, 1] = coeffs[w, w, 1, 1] = 1
+    coeffs[x, x, 1, 1] = coeffs[z, z, 1, 1] = -1
+    coeffs[z, z, 2, 2] = coeffs[w, w, 2, 2] = 1
+    coeffs[x, x, 2, 2] = coeffs[y, y, 2, 2] = -1
+
+    coeffs[x, y, 1, 0] = coeffs[z, w, 1, 0] = 2
+    coeffs[x, z, 2, 0], coeffs[y, w, 2, 0] = 2, -2
+
+    coeffs[x, y, 0, 1], coeffs[z, w, 0, 1] = 2, -2
+    coeffs[y, z, 2, 1] = coeffs[x, w, 2, 1] = 2
+
+    coeffs[x, z, 0, 2] = coeffs[y, w, 0, 2] = 2
+    coeffs[y, z, 1, 2], coeffs[x, w, 1, 2] = 2, -2
+
+    # Only the 10 products q[a] * q[b] with a <= b are distinct
+    return coeffs[_QUAT_PRODUCT_IND].reshape((10, 9))
+
+
+_QUAT_PRODUCT_IND = np.triu_indices(4)
+_QUAT_TO_DCM_COEFFS = _make_quat_to_dcm_coeffs()
+
+
+# Largest number of rotations for which `_quat_to_dcm` uses the matrix
+# product formulation. Beyond it the (N, 10) array of pairwise products no
+# longer fits in cache and the column-wise formulas are faster.
+_QUAT_TO_DCM_DOT_MAX_ROTATIONS = 2000
+
+
+def _quat_to_dcm(quat, out):
+    # Write the direction cosine matrices corresponding to the unit
+    # quaternions `quat`, shape (N, 4), into the preallocated `out`, shape
+    # (N, 3, 3).
+    num_rotations = quat.shape[0]
+
+    if num_rotations <= _QUAT_TO_DCM_DOT_MAX_ROTATIONS:
+        # For small stacks the cost is dominated by the number of NumPy
+        # calls: gather the distinct pairwise products of each quaternion's
+        # components and obtain all nine entries from a single matrix
+        # product, with the factors of 2 folded into the coefficients.
+        i, j = _QUAT_PRODUCT_IND
+        products = quat[:, i]
+        products *= quat[:, j]
+        coeffs = _QUAT_TO_DCM_COEFFS.astype(quat.dtype, copy=False)
+        if out.flags.c_contiguous and out.dtype == quat.dtype:
+            np.dot(products, coeffs, out=out.reshape((num_rotations, 9)))
+        else:
+            out[...] = np.dot(products, coeffs).reshape((num_rotations, 3, 3))
+        return out
+
+    # For large stacks the cost is dominated by memory traffic: evaluate the
+    # formulas column by column, doubling the off-diagonal products in place
+    # and writing each entry straight into `out`.
+    x = quat[:, 0]
+    y = quat[:, 1]
+    z = quat[:, 2]
+    w = quat[:, 3]
+
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    w2 = w * w
+
+    xy2 = x * y
+    xy2 *= 2
+    zw2 = z * w
+    zw2 *= 2
+    xz2 = x * z
+    xz2 *= 2
+    yw2 = y * w
+    yw2 *= 2
+    yz2 = y * z
+    yz2 *= 2
+    xw2 = x * w
+    xw2 *= 2
+
+    x2_y2 = x2 - y2
+    w2_z2 = w2 - z2
+
+    np.add(x2_y2, w2_z2, out=out[:, 0, 0])
+    np.add(xy2, zw2, out=out[:, 1, 0])
+    np.subtract(xz2, yw2, out=out[:, 2, 0])
+
+    np.subtract(xy2, zw2, out=out[:, 0, 1])
+    np.subtract(w2_z2, x2_y2, out=out[:, 1, 1])
+    np.add(yz2, xw2, out=out[:, 2, 1])
+
+    np.add(xz2, yw2, out=out[:, 0, 2])
+    np.subtract(yz2, xw2, out=out[:, 1, 2])
+    w2 -= x2
+    w2 -= y2
+    np.add(w2, z2, out=out[:, 2, 2])
+    return out
+
+
+def _dcm_to_quat(dcm, out):
+    # Write the unit quaternions corresponding to the direction cosine
+    # matrices `dcm`, shape (N, 3, 3), into the preallocated `out`, shape
+    # (N, 4), using the method of Markley (see `Rotation.from_dcm`). A single
+    # matrix is converted by `_single_dcm_to_quat` instead, which must be kept
+    # in sync with the branches below.
+    num_rotations = dcm.shape[0]
+
+    decision_matrix = np.empty((num_rotations, 4))
+    decision_matrix[:, :3] = dcm.diagonal(axis1=1, axis2=2)
+    decision_matrix[:, -1] = decision_matrix[:, :3].sum(axis=1)
+    choices = decision_matrix.argmax(axis=1)
+    trace = decision_matrix[:, -1]
+
+    # Rotations whose largest entry is on the diagonal: i is its index and
+    # (i, j, k) a cyclic permutation of (0, 1, 2)
+    ind = np.nonzero(choices != 3)[0]
+    i = choices[ind]
+    j = _NEXT_AXIS_IND[i]
+    k = _NEXT_AXIS_IND[j]
+
+    out[ind, i] = 1 - trace[ind] + 2 * dcm[ind, i, i]
+    out[ind, j] = dcm[ind, j, i] + dcm[ind, i, j]
+    out[ind, k] = dcm[ind, k, i] + dcm[ind, i, k]
+    out[ind, 3] = dcm[ind, k, j] - dcm[ind, j, k]
+
+    ind = np.nonzero(choices == 3)[0]
+    out[ind, 0] = dcm[ind, 2, 1] - dcm[ind, 1, 2]
+    out[ind, 1] = dcm[ind, 0, 2] - dcm[ind, 2, 0]
+    out[ind, 2] = dcm[ind, 1, 0] - dcm[ind, 0, 1]
+    out[ind, 3] = 1 + trace[ind]
+
+    out /= _row_norms(out)[:, None]
+    return out
+
+
+def _rotvec_to_quat_taylor(angle2):
+    # Taylor expansion of sin(angle / 2) / angle in terms of angle ** 2, for
+    # both scalars and arrays
+    return 0.5 - angle2 / 48 + angle2 * angle2 / 3840
+
+
+def _quat_to_rotvec_taylor(angle2):
+    # Taylor expansion of angle / sin(angle / 2) in terms of angle ** 2, for
+    # both scalars and arrays
+    return 2 + angle2 / 12 + 7 * angle2 * angle2 / 2880
+
+
+def _single_dcm_to_quat(dcm):
+    # Scalar version of `_dcm_to_quat` for a single 3 x 3 matrix, which
+    # avoids the overhead of the vectorized code for a single rotation. The
+    # branches must be kept in sync with `_dcm_to_quat`.
+    d = dcm.tolist()
+    trace = d[0][0] + d[1][1] + d[2][2]
+    decision = [d[0][0], d[1][1], d[2][2], trace]
+    choice = decision.index(max(decision))
+
+    if choice != 3:
+        i = choice
+        j = (i + 1) % 3
+        k = (j + 1) % 3
+        quat = [0.0] * 4
+        quat[i] = 1 - trace + 2 * d[i][i]
+        quat[j] = d[j][i] + d[i][j]
+        quat[k] = d[k][i] + d[i][k]
+        quat[3] = d[k][j] - d[j][k]
+    else:
+        quat = [d[2][1] - d[1][2], d[0][2] - d[2][0], d[1][0] - d[0][1],
+                1 + trace]
+
+    norm = math.sqrt(sum(q * q for q in quat))
+    return np.array([q / norm for q in quat])
+
+
+def _single_rotvec_to_quat(rotvec):
+    # Scalar version of the conversion in `Rotation.from_rotvec`.
+    x, y, z = rotvec.tolist()
+    angle = math.sqrt(x * x + y * y + z * z)
+
+    # `math.sin` and `math.cos` raise for an infinite angle (e.g. after
+    # overflow), where the vectorized code gives NaN; use NumPy in that case
+    if math.isinf(angle):
+        sin, cos = np.sin, np.cos
+    else:
+        sin, cos = math.sin, math.cos
+
+    if angle <= _SMALL_ANGLE:
+        scale = _rotvec_to_quat_taylor(angle * angle)
+    else:
+        scale = sin(angle / 2) / angle
+
+    return np.array([scale * x, scale * y, scale * z, cos(angle / 2)])
+
+
+def _single_quat_to_rotvec(quat):
+    # Scalar version of the conversion in `Rotation.as_rotvec`.
+    x, y, z, w = quat.tolist()
+    # w > 0 to ensure 0 <= angle <= pi
+    if w < 0:
+        x, y, z, w = -x, -y, -z, -w
+
+    angle = 2 * math.atan2(math.sqrt(x * x + y * y + z * z), w)
+
+    if angle <= _SMALL_ANGLE:
+        scale = _quat_to_rotvec_taylor(angle * angle)
+    else:
+        scale = angle / math.sin(angle / 2)
+
+    return np.array([scale * x, scale * y, scale * z])
+
+
+def _output_array(out, shape, dtype):
+    # Allocate the result of an `as_...` method, or validate the array
+    # supplied by the caller through the `out` parameter.
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+
+    if not isinstance(out, np.ndarray):
+        raise TypeError("Expected `out` to be a numpy.ndarray, got "
+                        "{}.".format(type(out)))
+    if out.shape != shape or out.dtype != dtype:
+        raise ValueError("Expected `out` to have shape {} and dtype {}, got "
+                         "shape {} and dtype {}.".format(shape, dtype,
+                                                         out.shape,
+                                                         out.dtype))
+    return out
+
+
 class Rotation(object):
     """Rotation in 3 dimensions.
 
@@ -352,7 +624,13 @@ class Rotation(object):
     """
     def __init__(self, quat, normalized=False, copy=True):
         self._single = False
-        quat = np.asarray(quat, dtype=float)
+        # Single precision quaternions are stored as given, anything else is
+        # converted to double precision.
+        quat = np.asarray(quat)
+        if quat.dtype not in (np.float32, np.float64):
+            # The conversion already produces an array owned by this object
+            quat = quat.astype(np.float64)
+            copy = False
 
         if quat.ndim not in [1, 2] or quat.shape[-1] != 4:
             raise ValueError("Expected `quat` to have shape (4,) or (N x 4), "
@@ -368,15 +646,16 @@ class Rotation(object):
         if normalized:
             self._quat = quat.copy() if copy else quat
         else:
-            self._quat = quat.copy()
-            norms = scipy.linalg.norm(quat, axis=1)
+            norms = _row_norms(quat)
 
-            zero_norms = norms == 0
-            if zero_norms.any():
+            if (norms == 0).any():
                 raise ValueError("Found zero norm quaternions in `quat`.")
+            if not np.isfinite(norms).all():
+                raise ValueError("Found infs or NaNs in `quat`.")
 
+            # Dividing into a new array makes copying the input unnecessary.
             # Ensure norm is broadcasted along each column.
-            self._quat[~zero_norms] /= norms[~zero_norms][:, None]
+            self._quat = quat / norms[:, None]
 
     def __len__(self):
         """Number of rotations contained in this object.
@@ -400,7 +679,11 @@ class Rotation(object):
         ----------
         quat : array_like, shape (N, 4) or (4,)
             Each row is a (possibly non-unit norm) quaternion in scalar-last
-            (x, y, z, w) format.
+            (x, y, z, w) format. Single precision (`numpy.float32`) input is
+            stored in single precision, and `as_quat`, `as_dcm` and
+            `as_rotvec` then also return single precision arrays; `as_euler`
+            and `apply` compute in double precision from the stored
+            quaternions. Any other input is converted to double precision.
         normalized : boolean, optional
             If `False`, input quaternions are normalized to unit norm before
             being stored. If `True`, quaternions are assumed to already have
@@ -549,51 +832,21 @@ class Rotation(object):
         >>> r.as_dcm().shape
         (1, 3, 3)
         """
-        is_single = False
         dcm = np.asarray(dcm, dtype=float)
 
         if dcm.ndim not in [2, 3] or dcm.shape[-2:] != (3, 3):
             raise ValueError("Expected `dcm` to have shape (3, 3) or "
                              "(N, 3, 3), got {}".format(dcm.shape))
 
-        # If a single dcm is given, convert it to 3D 1 x 3 x 3 matrix but set
-        # self._single to True so that we can return appropriate objects in
-        # the `to_...` methods
+        # A single dcm gives a single rotation, whose quaternion only needs a
+        # few scalar operations
         if dcm.shape == (3, 3):
-            dcm = dcm.reshape((1, 3, 3))
-            is_single = True
+            return cls(_single_dcm_to_quat(dcm), normalized=True, copy=False)
 
         num_rotations = dcm.shape[0]
 
-        decision_matrix = np.empty((num_rotations, 4))
-        decision_matrix[:, :3] = dcm.diagonal(axis1=1, axis2=2)
-        decision_matrix[:, -1] = decision_matrix[:, :3].sum(axis=1)
-        choices = decision_matrix.argmax(axis=1)
-
-        quat = np.empty((num_rotations, 4))
-
-        ind = np.nonzero(choices != 3)[0]
-        i = choices[ind]
-        j = (i + 1) % 3
-        k = (j + 1) % 3
-
-        quat[ind, i] = 1 - decision_matrix[ind, -1] + 2 * dcm[ind, i, i]
-        quat[ind, j] = dcm[ind, j, i] + dcm[ind, i, j]
-        quat[ind, k] = dcm[ind, k, i] + dcm[ind, i, k]
-        quat[ind, 3] = dcm[ind, k, j] - dcm[ind, j, k]
-
-        ind = np.nonzero(choices == 3)[0]
-        quat[ind, 0] = dcm[ind, 2, 1] - dcm[ind, 1, 2]
-        quat[ind, 1] = dcm[ind, 0, 2] - dcm[ind, 2, 0]
-        quat[ind, 2] = dcm[ind, 1, 0] - dcm[ind, 0, 1]
-        quat[ind, 3] = 1 + decision_matrix[ind, -1]
-
-        quat /= np.linalg.norm(quat, axis=1)[:, None]
-
-        if is_single:
-            return cls(quat[0], normalized=True, copy=False)
-        else:
-            return cls(quat, normalized=True, copy=False)
+        quat = _dcm_to_quat(dcm, np.empty((num_rotations, 4)))
+        return cls(quat, normalized=True, copy=False)
 
     @classmethod
     def from_rotvec(cls, rotvec):
@@ -649,40 +902,37 @@ class Rotation(object):
         >>> r.as_rotvec().shape
         (1, 3)
         """
-        is_single = False
         rotvec = np.asarray(rotvec, dtype=float)
 
         if rotvec.ndim not in [1, 2] or rotvec.shape[-1] != 3:
             raise ValueError("Expected `rot_vec` to have shape (3,) "
                              "or (N, 3), got {}".format(rotvec.shape))
 
-        # If a single vector is given, convert it to a 2D 1 x 3 matrix but
-        # set self._single to True so that we can return appropriate objects
-        # in the `as_...` methods
+        # A single vector gives a single rotation, whose quaternion only needs
+        # a few scalar operations
         if rotvec.shape == (3,):
-            rotvec = rotvec[None, :]
-            is_single = True
+            return cls(_single_rotvec_to_quat(rotvec), normalized=True,
+                       copy=False)
 
         num_rotations = rotvec.shape[0]
 
-        norms = np.linalg.norm(rotvec, axis=1)
-        small_angle = (norms <= 1e-3)
-        large_angle = ~small_angle
+        norms = _row_norms(rotvec)
+        small_angle = (norms <= _SMALL_ANGLE)
 
-        scale = np.empty(num_rotations)
-        scale[small_angle] = (0.5 - norms[small_angle] ** 2 / 48 +
-                              norms[small_angle] ** 4 / 3840)
-        scale[large_angle] = (np.sin(norms[large_angle] / 2) /
-                              norms[large_angle])
+        # Evaluate both the Taylor expansion and the exact expression for all
+        # rotations and blend them, which is cheaper than gathering and
+        # scattering the two subsets. Small angles are replaced by 1 in the
+        # exact expression to avoid dividing by zero.
+        safe_norms = np.where(small_angle, 1, norms)
+        scale = np.where(small_angle,
+                         _rotvec_to_quat_taylor(norms * norms),
+                         np.sin(safe_norms / 2) / safe_norms)
 
         quat = np.empty((num_rotations, 4))
         quat[:, :3] = scale[:, None] * rotvec
         quat[:, 3] = np.cos(norms / 2)
 
-        if is_single:
-            return cls(quat[0], normalized=True, copy=False)
-        else:
-            return cls(quat, normalized=True, copy=False)
+        return cls(quat, normalized=True, copy=False)
 
     @classmethod
     def from_euler(cls, seq, angles, degrees=False):
@@ -783,8 +1033,8 @@ class Rotation(object):
             raise ValueError("Expected axis specification to be a non-empty "
                              "string of upto 3 characters, got {}".format(seq))
 
-        intrinsic = (re.match(r'^[XYZ]{1,3}$', seq) is not None)
-        extrinsic = (re.match(r'^[xyz]{1,3}$', seq) is not None)
+        intrinsic = (_INTRINSIC_RE.match(seq) is not None)
+        extrinsic = (_EXTRINSIC_RE.match(seq) is not None)
         if not (intrinsic or extrinsic):
             raise ValueError("Expected axes from `seq` to be from ['x', 'y', "
                              "'z'] or ['X', 'Y', 'Z'], got {}".format(seq))
@@ -837,7 +1087,7 @@ class Rotation(object):
         quat = _elementary_quat_compose(seq, angles, intrinsic)
         return cls(quat[0] if is_single else quat, normalized=True, copy=False)
 
-    def as_quat(self):
+    def as_quat(self, out=None):
         """Represent as quaternions.
 
         Rotations in 3 dimensions can be represented using unit norm
@@ -845,6 +1095,15 @@ class Rotation(object):
         two-to-one, i.e. quaternions `q` and `-q`, where `-q` simply reverses
         the sign of each component, represent the same spatial rotation.
 
+        Parameters
+        ----------
+        out : `numpy.ndarray`, optional
+            Array in which to store the result, e.g. to reuse a buffer across
+            calls. It must have the shape of the returned array and the dtype
+            of the stored quaternions, which is `numpy.float64` unless the
+            object was initialized with `numpy.float32` quaternions. If not
+            given, a new array is allocated.
+
         Returns
         -------
         quat : `numpy.ndarray`, shape (4,) or (N, 4)
@@ -883,16 +1142,28 @@ class Rotation(object):
         (2, 4)
         """
         if self._single:
-            return self._quat[0].copy()
+            out = _output_array(out, (4,), self._quat.dtype)
+            out[...] = self._quat[0]
         else:
-            return self._quat.copy()
+            out = _output_array(out, self._quat.shape, self._quat.dtype)
+            out[...] = self._quat
+        return out
 
-    def as_dcm(self):
+    def as_dcm(self, out=None):
         """Represent as direction cosine matrices.
 
         3D rotations can be represented using direction cosine matrices, which
         are 3 x 3 real orthogonal matrices with determinant equal to +1 [1]_.
 
+        Parameters
+        ----------
+        out : `numpy.ndarray`, optional
+            Array in which to store the result, e.g. to reuse a buffer across
+            calls. It must have the shape of the returned array and the dtype
+            of the stored quaternions, which is `numpy.float64` unless the
+            object was initialized with `numpy.float32` quaternions. If not
+            given, a new array is allocated.
+
         Returns
         -------
         dcm : `numpy.ndarray`, shape (3, 3) or (N, 3, 3)
@@ -941,50 +1212,30 @@ class Rotation(object):
         (2, 3, 3)
         """
 
-        x = self._quat[:, 0]
-        y = self._quat[:, 1]
-        z = self._quat[:, 2]
-        w = self._quat[:, 3]
-
-        x2 = x * x
-        y2 = y * y
-        z2 = z * z
-        w2 = w * w
-
-        xy = x * y
-        zw = z * w
-        xz = x * z
-        yw = y * w
-        yz = y * z
-        xw = x * w
-
-        num_rotations = len(self)
-        dcm = np.empty((num_rotations, 3, 3))
-
-        dcm[:, 0, 0] = x2 - y2 - z2 + w2
-        dcm[:, 1, 0] = 2 * (xy + zw)
-        dcm[:, 2, 0] = 2 * (xz - yw)
-
-        dcm[:, 0, 1] = 2 * (xy - zw)
-        dcm[:, 1, 1] = - x2 + y2 - z2 + w2
-        dcm[:, 2, 1] = 2 * (yz + xw)
-
-        dcm[:, 0, 2] = 2 * (xz + yw)
-        dcm[:, 1, 2] = 2 * (yz - xw)
-        dcm[:, 2, 2] = - x2 - y2 + z2 + w2
-
         if self._single:
-            return dcm[0]
+            out = _output_array(out, (3, 3), self._quat.dtype)
+            _quat_to_dcm(self._quat, out[None, :, :])
         else:
-            return dcm
+            out = _output_array(out, (len(self), 3, 3), self._quat.dtype)
+            _quat_to_dcm(self._quat, out)
+        return out
 
-    def as_rotvec(self):
+    def as_rotvec(self, out=None):
         """Represent as rotation vectors.
 
         A rotation vector is a 3 dimensional vector which is co-directional to
         the axis of rotation and whose norm gives the angle of rotation (in
         radians) [1]_.
 
+        Parameters
+        ----------
+        out : `numpy.ndarray`, optional
+            Array in which to store the result, e.g. to reuse a buffer across
+            calls. It must have the shape of the returned array and the dtype
+            of the stored quaternions, which is `numpy.float64` unless the
+            object was initialized with `numpy.float32` quaternions. If not
+            given, a new array is allocated.
+
         Returns
         -------
         rotvec : `numpy.ndarray`, shape (3,) or (N, 3)
@@ -1024,28 +1275,32 @@ class Rotation(object):
         >>> r.as_rotvec().shape
         (2, 3)
         """
-        quat = self._quat.copy()
-        # w > 0 to ensure 0 <= angle <= pi
-        quat[quat[:, 3] < 0] *= -1
+        if self._single:
+            out = _output_array(out, (3,), self._quat.dtype)
+            out[...] = _single_quat_to_rotvec(self._quat[0])
+            return out
 
-        angle = 2 * np.arctan2(np.linalg.norm(quat[:, :3], axis=1), quat[:, 3])
+        xyz = self._quat[:, :3]
+        w = self._quat[:, 3]
 
-        small_angle = (angle <= 1e-3)
-        large_angle = ~small_angle
+        # w > 0 to ensure 0 <= angle <= pi. Instead of flipping the sign of a
+        # copy of the quaternions, fold the sign into |w| here and into the
+        # scale factor below; the norm of the vector part is unaffected.
+        sign = np.where(w < 0, -1, 1)
+        angle = 2 * np.arctan2(_row_norms(xyz), np.abs(w))
 
-        num_rotations = len(self)
-        scale = np.empty(num_rotations)
-        scale[small_angle] = (2 + angle[small_angle] ** 2 / 12 +
-                              7 * angle[small_angle] ** 4 / 2880)
-        scale[large_angle] = (angle[large_angle] /
-                              np.sin(angle[large_angle] / 2))
+        small_angle = (angle <= _SMALL_ANGLE)
 
-        rotvec = scale[:, None] * quat[:, :3]
+        # Blend the Taylor expansion and the exact expression, see
+        # `from_rotvec`.
+        safe_angle = np.where(small_angle, 1, angle)
+        scale = np.where(small_angle,
+                         _quat_to_rotvec_taylor(angle * angle),
+                         safe_angle / np.sin(safe_angle / 2))
 
-        if self._single:
-            return rotvec[0]
-        else:
-            return rotvec
+        out = _output_array(out, (len(self), 3), self._quat.dtype)
+        np.multiply((sign * scale)[:, None], xyz, out=out)
+        return out
 
     def as_euler(self, seq, degrees=False):
         """Represent as Euler angles.
@@ -1136,8 +1391,8 @@ class Rotation(object):
         if len(seq) != 3:
             raise ValueError("Expected 3 axes, got {}.".format(seq))
 
-        intrinsic = (re.match(r'^[XYZ]{1,3}$', seq) is not None)
-        extrinsic = (re.match(r'^[xyz]{1,3}$', seq) is not None)
+        intrinsic = (_INTRINSIC_RE.match(seq) is not None)
+        extrinsic = (_EXTRINSIC_RE.match(seq) is not None)
         if not (intrinsic or extrinsic):
             raise ValueError("Expected axes from `seq` to be from "
                              "['x', 'y', 'z'] or ['X', 'Y', 'Z'], "
@@ -1149,7 +1404,11 @@ class Rotation(object):
 
         seq = seq.lower()
 
-        angles = _compute_euler_from_dcm(self.as_dcm(), seq, extrinsic)
+        # Always work with double precision matrices, the algorithm loses too
+        # much accuracy near gimbal lock in single precision
+        dcm = _quat_to_dcm(_double_precision_quat(self._quat),
+                           np.empty((len(self), 3, 3)))
+        angles = _compute_euler_from_dcm(dcm, seq, extrinsic)
         if degrees:
             angles = np.rad2deg(angles)
 
@@ -1282,9 +1541,9 @@ class Rotation(object):
             single_vector = True
             vectors = vectors[None, :]
 
-        dcm = self.as_dcm()
-        if self._single:
-            dcm = dcm[None, :, :]
+        # Rotate in double precision regardless of the storage precision
+        dcm = _quat_to_dcm(_double_precision_quat(self._quat),
+                           np.empty((len(self), 3, 3)))
 
         n_vectors = vectors.shape[0]
         n_rotations = len(self)
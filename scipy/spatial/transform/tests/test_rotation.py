@@ -67,6 +67,13 @@ def test_zero_norms_from_quat():
         Rotation.from_quat(x)
 
 
+def test_non_finite_from_quat():
+    for x in [[np.inf, 0, 0, 1], [0, np.nan, 0, 1], [[1, 0, 0, 0],
+                                                     [0, 0, -np.inf, 1]]]:
+        with pytest.raises(ValueError, match='infs or NaNs'):
+            Rotation.from_quat(x)
+
+
 def test_as_dcm_single_1d_quaternion():
     quat = [0, 0, 0, 1]
     mat = Rotation.from_quat(quat).as_dcm()
@@ -145,6 +152,18 @@ def test_as_dcm_from_generic_input():
     assert_array_almost_equal(mat[2], expected2)
 
 
+def test_as_dcm_large_stack():
+    # Large stacks are converted with a different formulation than small
+    # ones, compare both
+    r = Rotation.random(3000, random_state=0)
+    dcm = r.as_dcm()
+    for start in range(0, 3000, 1000):
+        assert_allclose(dcm[start:start + 1000],
+                        r[start:start + 1000].as_dcm(), atol=1e-15)
+    assert_allclose(np.einsum('nij,nkj->nik', dcm, dcm),
+                    np.tile(np.eye(3), (3000, 1, 1)), atol=1e-14)
+
+
 def test_from_single_2d_dcm():
     dcm = [
             [0, 0, 1],
@@ -350,6 +369,33 @@ def test_from_euler_elementary_extrinsic_rotation():
     assert_array_almost_equal(dcm, expected_dcm)
 
 
+def test_from_euler_composition_order():
+    # Intrinsic rotations compose by right multiplication of elementary
+    # DCMs, extrinsic rotations by left multiplication
+    def elementary_dcm(axis, angle):
+        c, s = np.cos(angle), np.sin(angle)
+        i = 'xyz'.index(axis)
+        j, k = (i + 1) % 3, (i + 2) % 3
+        dcm = np.eye(3)
+        dcm[j, j] = dcm[k, k] = c
+        dcm[k, j] = s
+        dcm[j, k] = -s
+        return dcm
+
+    np.random.seed(0)
+    angles = np.random.uniform(low=-np.pi, high=np.pi, size=(5, 3))
+    for seq in ['xyz', 'zxy', 'zyz', 'yxy']:
+        extrinsic = Rotation.from_euler(seq, angles).as_dcm()
+        intrinsic = Rotation.from_euler(seq.upper(), angles).as_dcm()
+        for n in range(angles.shape[0]):
+            dcms = [elementary_dcm(axis, angle)
+                    for axis, angle in zip(seq, angles[n])]
+            assert_allclose(intrinsic[n],
+                            dcms[0].dot(dcms[1]).dot(dcms[2]), atol=1e-12)
+            assert_allclose(extrinsic[n],
+                            dcms[2].dot(dcms[1]).dot(dcms[0]), atol=1e-12)
+
+
 def test_from_euler_intrinsic_rotation_312():
     angles = [
         [30, 60, 45],
@@ -773,6 +819,123 @@ def test_quat_ownership():
     assert_allclose(s._quat[0], np.array([1, 0, 0, 0]))
 
 
+def test_float32_storage():
+    quat = np.array([
+        [0, 0, 1, 1],
+        [1, 2, 3, 4]
+    ], dtype=np.float32)
+    r = Rotation.from_quat(quat)
+    r_double = Rotation.from_quat(quat.astype(np.float64))
+
+    assert_equal(r.as_quat().dtype, np.float32)
+    assert_equal(r.as_dcm().dtype, np.float32)
+    assert_equal(r.as_rotvec().dtype, np.float32)
+    assert_equal(r.inv().as_quat().dtype, np.float32)
+    assert_equal((r * r).as_quat().dtype, np.float32)
+
+    assert_allclose(r.as_quat(), r_double.as_quat(), rtol=1e-6)
+    assert_allclose(r.as_dcm(), r_double.as_dcm(), rtol=1e-6, atol=1e-6)
+    assert_allclose(r.as_rotvec(), r_double.as_rotvec(), rtol=1e-6)
+
+
+def test_float32_as_euler_apply_near_gimbal_lock():
+    # Euler angles and applied rotations are computed in double precision
+    # from the stored single precision quaternions
+    for mid in [1e-3, 1e-4]:
+        angles = np.array([0.3, mid, 0.1])
+        quat = Rotation.from_euler('zyz', angles).as_quat()
+        r = Rotation.from_quat(quat.astype(np.float32))
+        r_double = Rotation.from_quat(quat.astype(np.float32).astype(float))
+
+        assert_equal(r.as_euler('zyz').dtype, np.float64)
+        assert_allclose(r.as_euler('zyz'), r_double.as_euler('zyz'))
+        assert_allclose(r.as_euler('zyz'), angles, rtol=1e-3)
+
+        v = [1, 2, 3]
+        assert_allclose(r.apply(v), r_double.apply(v), rtol=1e-15)
+
+
+def test_non_float_input_stored_as_double():
+    assert_equal(Rotation.from_quat([0, 0, 1, 1]).as_quat().dtype, np.float64)
+    quat = np.array([0, 0, 1, 1], dtype=np.float16)
+    assert_equal(Rotation.from_quat(quat).as_quat().dtype, np.float64)
+
+
+def test_as_representations_out():
+    r = Rotation.from_quat([[0, 0, 1, 1], [1, 2, 3, 4]])
+    for method, shape in [('as_quat', (2, 4)), ('as_dcm', (2, 3, 3)),
+                          ('as_rotvec', (2, 3))]:
+        out = np.empty(shape)
+        result = getattr(r, method)(out=out)
+        assert result is out
+        assert_allclose(out, getattr(r, method)())
+
+
+def test_as_representations_out_single():
+    r = Rotation.from_quat([1, 2, 3, 4])
+    for method, shape in [('as_quat', (4,)), ('as_dcm', (3, 3)),
+                          ('as_rotvec', (3,))]:
+        out = np.empty(shape)
+        result = getattr(r, method)(out=out)
+        assert result is out
+        assert_allclose(out, getattr(r, method)())
+
+
+def test_as_dcm_out_non_contiguous():
+    r = Rotation.from_quat([[0, 0, 1, 1], [1, 2, 3, 4]])
+    out = np.zeros((2, 3, 6))[:, :, ::2]
+    r.as_dcm(out=out)
+    assert_allclose(out, r.as_dcm())
+
+
+def test_malformed_out():
+    r = Rotation.from_quat([[0, 0, 1, 1], [1, 2, 3, 4]])
+    with pytest.raises(ValueError, match='shape'):
+        r.as_dcm(out=np.empty((3, 3)))
+    with pytest.raises(ValueError, match='dtype'):
+        r.as_rotvec(out=np.empty((2, 3), dtype=np.float32))
+    with pytest.raises(TypeError):
+        r.as_quat(out=[[0, 0, 0, 1], [0, 0, 0, 1]])
+
+
+def test_single_rotation_matches_stack():
+    # Single rotations take a separate scalar code path
+    dcm = np.array([
+        np.eye(3),
+        np.diag([1, -1, -1]),
+        np.diag([-1, 1, -1]),
+        np.diag([-1, -1, 1]),
+    ])
+    dcm = np.concatenate((dcm, special_ortho_group.rvs(3, size=10,
+                                                       random_state=0)))
+    stack = Rotation.from_dcm(dcm)
+    for n in range(len(dcm)):
+        single = Rotation.from_dcm(dcm[n])
+        assert_allclose(single.as_quat(), stack.as_quat()[n])
+        assert_allclose(single.as_rotvec(), stack.as_rotvec()[n],
+                        atol=1e-15)
+
+    np.random.seed(0)
+    rotvec = np.concatenate((np.random.normal(size=(10, 3)),
+                             1e-4 * np.random.normal(size=(5, 3)),
+                             np.zeros((1, 3))))
+    stack = Rotation.from_rotvec(rotvec)
+    for n in range(len(rotvec)):
+        single = Rotation.from_rotvec(rotvec[n])
+        assert_allclose(single.as_quat(), stack.as_quat()[n])
+        assert_allclose(single.as_rotvec(), stack.as_rotvec()[n],
+                        atol=1e-15)
+
+    # Infinite norms, also through overflow, give NaN rotations on both paths
+    rotvec = np.array([[np.inf, 0, 0], [1e200, 0, 0]])
+    with np.errstate(invalid='ignore', over='ignore'):
+        stack = Rotation.from_rotvec(rotvec)
+        for n in range(len(rotvec)):
+            single = Rotation.from_rotvec(rotvec[n])
+            assert_equal(single.as_quat(), stack.as_quat()[n])
+            assert np.isnan(single.as_quat()).all()
+
+
 def test_random_rotation_shape():
     assert_equal(Rotation.random().as_quat().shape, (4,))
     assert_equal(Rotation.random(None).as_quat().shape, (4,))